@@ -1,15 +1,96 @@
+import bisect  # For threshold lookups on sorted constants
+import collections  # For the per-date totals index
+import csv  # For batch log imports
 import datetime  # For timestamps
 import json  # For saving/loading data
 import os  # To check if file exists
 
+import numpy as np  # For fast columnar summaries
+import pandas as pd  # For Parquet storage of large log histories
+
+try:
+    from numba import njit  # Optional: compiles the bulk kernels to machine code
+except ImportError:
+    def njit(*args, **kwargs):  # Fall back to plain NumPy if numba isn't installed
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Harris-Benedict BMR; plain functions take scalars or whole arrays, and the
+# _vec aliases are the numba-compiled versions used for parameter sweeps
+def _bmr_male(weights, heights, ages):
+    return 88.362 + 13.397 * weights + 4.799 * heights - 5.677 * ages
+
+def _bmr_female(weights, heights, ages):
+    return 447.593 + 9.247 * weights + 3.098 * heights - 4.330 * ages
+
+_bmr_male_vec = njit(cache=True)(_bmr_male)
+_bmr_female_vec = njit(cache=True)(_bmr_female)
+
+# Branchless daily-calorie targets for a whole cohort: the +/-500 cut or
+# surplus branch becomes an np.where over the weight-difference array
+def bulk_daily_calories(tdee_arr, weight_arr, goal_arr):
+    diff = np.asarray(goal_arr, dtype=np.float64) - np.asarray(weight_arr, dtype=np.float64)
+    return np.asarray(tdee_arr, dtype=np.float64) + np.where(diff < 0, -500.0, np.where(diff > 0, 500.0, 0.0))
+
+# WHO BMI category boundaries; bisect indexes straight into the labels
+_BMI_THRESHOLDS = (18.5, 25.0, 30.0)
+_BMI_LABELS = ("Underweight", "Normal", "Overweight", "Obese")
+
+# Calories per gram of protein, carbs, fats
+_KCAL_PER_G = np.array([4.0, 4.0, 9.0])
+
+# TDEE multiplier per activity level (built once, not per calculate_tdee call)
+_ACTIVITY_FACTORS = {'sedentary': 1.2, 'light': 1.375, 'moderate': 1.55, 'active': 1.725, 'very_active': 1.9}
+
+def _empty_day_totals():
+    return {'calories': 0.0, 'protein': 0.0, 'carbs': 0.0, 'fats': 0.0, 'burned': 0.0}
+
 class FitnessTracker:
-    def __init__(self, height, weight, goal_weight, age, gender, activity_level):
+    # Slots drop the per-instance __dict__: smaller objects and faster
+    # attribute access when simulating many profiles at once
+    __slots__ = (
+        'height', 'weight', 'goal_weight', 'age', 'gender', 'activity_level',
+        'verbose', 'bmr', 'tdee', 'daily_calorie_goal', 'bmi', 'macro_goals',
+        'food_dates', 'food_meals', 'food_calories', 'food_protein',
+        'food_carbs', 'food_fats', 'exercise_dates', 'exercise_activities',
+        'exercise_calories', '_tdee_factor', '_bmr_fn', '_net_goal_offset',
+        '_check_macros', '_daily_totals', '_today_cache'
+    )
+
+    def __init__(self, height, weight, goal_weight, age, gender, activity_level, verbose=True):
+        self.verbose = verbose  # New: gate per-log prints (turn off for bulk imports)
+        self.update_profile(height, weight, goal_weight, age, gender, activity_level)
+        # Logs are stored columnar (parallel lists) so summaries can reduce
+        # whole columns with NumPy instead of indexing dicts row by row
+        self.food_dates = []
+        self.food_meals = []
+        self.food_calories = []
+        self.food_protein = []
+        self.food_carbs = []
+        self.food_fats = []
+        self.exercise_dates = []
+        self.exercise_activities = []
+        self.exercise_calories = []
+        # Running totals per date, updated at log time, so daily_summary
+        # is a dict lookup instead of a scan over the whole history
+        self._daily_totals = collections.defaultdict(_empty_day_totals)
+        self._today_cache = (None, None)  # (date object, iso string)
+        # New: Default macro goals (as % of calories; can be customized later)
+        self.macro_goals = {'protein': 0.30, 'carbs': 0.50, 'fats': 0.20}  # Adjust via update if needed
+        self._compile_macro_check()
+        print(f"Onboarding complete! BMR: {self.bmr:.0f} cal, TDEE: {self.tdee:.0f} cal, Daily Goal: {self.daily_calorie_goal:.0f} cal.")
+        print(f"BMI: {self.bmi:.1f} ({self.get_bmi_category()}). Remember, consult a doctor for health advice.")
+
+    # New: Update the profile in place — logs, the date index and caches all
+    # survive, and only the derived fields are recomputed
+    def update_profile(self, height, weight, goal_weight, age, gender, activity_level):
         # New: Validation
         if height <= 0 or weight <= 0 or goal_weight <= 0 or age < 18 or age > 100:
             raise ValueError("Invalid values: Height/weight must be >0, age 18-100.")
         if gender.lower() not in ['male', 'female']:
             raise ValueError("Gender must be 'male' or 'female'.")
-        if activity_level.lower() not in ['sedentary', 'light', 'moderate', 'active', 'very_active']:
+        if activity_level.lower() not in _ACTIVITY_FACTORS:
             raise ValueError("Invalid activity level.")
 
         self.height = height  # cm
@@ -18,33 +99,32 @@ class FitnessTracker:
         self.age = age  # years
         self.gender = gender.lower()
         self.activity_level = activity_level.lower()
+        self._tdee_factor = _ACTIVITY_FACTORS[self.activity_level]
+        # Resolve the gender branch once; calculate_bmr is then pure FP math
+        self._bmr_fn = _bmr_male if self.gender == 'male' else _bmr_female
         self.bmr = self.calculate_bmr()
         self.tdee = self.calculate_tdee()
         self.daily_calorie_goal = self.calculate_daily_calories()
+        # Constant until the profile changes; daily_summary compares against it
+        self._net_goal_offset = self.daily_calorie_goal - self.tdee + self.bmr
         # New: BMI calculation (WHO formula)
         self.bmi = weight / ((height / 100) ** 2)
-        bmi_category = self.get_bmi_category()
-        self.food_logs = []
-        self.exercise_logs = []
-        # New: Default macro goals (as % of calories; can be customized later)
-        self.macro_goals = {'protein': 0.30, 'carbs': 0.50, 'fats': 0.20}  # Adjust via update if needed
-        print(f"Onboarding complete! BMR: {self.bmr:.0f} cal, TDEE: {self.tdee:.0f} cal, Daily Goal: {self.daily_calorie_goal:.0f} cal.")
-        print(f"BMI: {self.bmi:.1f} ({bmi_category}). Remember, consult a doctor for health advice.")
+
+    def _compile_macro_check(self):
+        # Bake the current macro goals into a closure over a constant vector,
+        # so daily_summary skips the per-call dict lookups; recompile whenever
+        # macro_goals changes
+        goals = np.array([self.macro_goals['protein'], self.macro_goals['carbs'], self.macro_goals['fats']])
+        self._check_macros = lambda pct: np.abs(pct - goals) > 0.20
 
     def get_bmi_category(self):
-        if self.bmi < 18.5: return "Underweight"
-        elif self.bmi < 25: return "Normal"
-        elif self.bmi < 30: return "Overweight"
-        else: return "Obese"
+        return _BMI_LABELS[bisect.bisect_right(_BMI_THRESHOLDS, self.bmi)]
 
     def calculate_bmr(self):
-        if self.gender == 'male':
-            return 88.362 + (13.397 * self.weight) + (4.799 * self.height) - (5.677 * self.age)
-        return 447.593 + (9.247 * self.weight) + (3.098 * self.height) - (4.330 * self.age)
+        return self._bmr_fn(self.weight, self.height, self.age)
 
     def calculate_tdee(self):
-        factors = {'sedentary': 1.2, 'light': 1.375, 'moderate': 1.55, 'active': 1.725, 'very_active': 1.9}
-        return self.bmr * factors[self.activity_level]
+        return self.bmr * self._tdee_factor
 
     def calculate_daily_calories(self):
         weight_diff = self.goal_weight - self.weight
@@ -52,45 +132,80 @@ class FitnessTracker:
         elif weight_diff > 0: return self.tdee + 500
         return self.tdee
 
+    def _today(self):
+        # isoformat() allocates a fresh string each call, which adds up
+        # during bulk imports; cache it until the date actually changes
+        today = datetime.date.today()
+        if today != self._today_cache[0]:
+            self._today_cache = (today, today.isoformat())
+        return self._today_cache[1]
+
+    # New: Vectorized what-if targets across many profiles at once
+    @classmethod
+    def bulk_targets(cls, weights, heights, ages, genders, activity_levels):
+        weights = np.asarray(weights, dtype=np.float64)
+        heights = np.asarray(heights, dtype=np.float64)
+        ages = np.asarray(ages, dtype=np.float64)
+        male = np.asarray([g.lower() == 'male' for g in genders])
+        bmr = np.where(male,
+                       _bmr_male_vec(weights, heights, ages),
+                       _bmr_female_vec(weights, heights, ages))
+        tdee = bmr * np.asarray([_ACTIVITY_FACTORS[a.lower()] for a in activity_levels])
+        return bmr, tdee
+
     def log_food(self, meal, calories, protein=0, carbs=0, fats=0):
-        today = datetime.date.today().isoformat()
-        self.food_logs.append({
-            'date': today, 'meal': meal, 'calories': calories,
-            'nutrition': {'protein': protein, 'carbs': carbs, 'fats': fats}
-        })
-        print(f"Logged {meal}: {calories} cal.")
+        today = self._today()
+        self.food_dates.append(today)
+        self.food_meals.append(meal)
+        self.food_calories.append(calories)
+        self.food_protein.append(protein)
+        self.food_carbs.append(carbs)
+        self.food_fats.append(fats)
+        day = self._daily_totals[today]
+        day['calories'] += calories
+        day['protein'] += protein
+        day['carbs'] += carbs
+        day['fats'] += fats
+        if self.verbose:
+            print(f"Logged {meal}: {calories} cal.")
 
     def log_exercise(self, activity, calories_burned):
-        today = datetime.date.today().isoformat()
-        self.exercise_logs.append({
-            'date': today, 'activity': activity, 'calories_burned': calories_burned
-        })
-        print(f"Logged {activity}: {calories_burned} cal burned.")
+        today = self._today()
+        self.exercise_dates.append(today)
+        self.exercise_activities.append(activity)
+        self.exercise_calories.append(calories_burned)
+        self._daily_totals[today]['burned'] += calories_burned
+        if self.verbose:
+            print(f"Logged {activity}: {calories_burned} cal burned.")
 
     def daily_summary(self, date_str=None):
         if date_str is None:
-            date_str = datetime.date.today().isoformat()
-        food_cal = sum(log['calories'] for log in self.food_logs if log['date'] == date_str)
-        exercise_cal = sum(log['calories_burned'] for log in self.exercise_logs if log['date'] == date_str)
+            date_str = self._today()
+        # Totals are maintained incrementally at log time, so a day's
+        # summary is one dict lookup regardless of how long the history is
+        totals = self._daily_totals.get(date_str) or _empty_day_totals()
+        food_cal = totals['calories']
+        total_protein = totals['protein']
+        total_carbs = totals['carbs']
+        total_fats = totals['fats']
+        exercise_cal = totals['burned']
         net_cal = food_cal - exercise_cal - self.bmr
-        cal_diff = net_cal - (self.daily_calorie_goal - self.tdee + self.bmr)  # Adjust for net vs goal
+        cal_diff = net_cal - self._net_goal_offset  # Adjust for net vs goal
         status = "under" if cal_diff < 0 else "over" if cal_diff > 0 else "on"
         print(f"For {date_str}: Eaten {food_cal} cal, Burned {exercise_cal} cal (exercise), Net {net_cal} cal.")
         print(f"You're {abs(cal_diff):.0f} cal {status} goal. Keep going!")
 
-        # Macro breakdown with warnings
-        total_protein = sum(log['nutrition']['protein'] for log in self.food_logs if log['date'] == date_str)
-        total_carbs = sum(log['nutrition']['carbs'] for log in self.food_logs if log['date'] == date_str)
-        total_fats = sum(log['nutrition']['fats'] for log in self.food_logs if log['date'] == date_str)
-        total_macros_cal = (total_protein * 4) + (total_carbs * 4) + (total_fats * 9)
+        # Macro breakdown with warnings — one vectorized pass over all three
+        macro_kcal = np.array([total_protein, total_carbs, total_fats]) * _KCAL_PER_G
+        total_macros_cal = macro_kcal.sum()
         if total_macros_cal > 0:
-            protein_pct = (total_protein * 4 / total_macros_cal)
-            carbs_pct = (total_carbs * 4 / total_macros_cal)
-            fats_pct = (total_fats * 9 / total_macros_cal)
+            pct = macro_kcal / total_macros_cal
+            protein_pct, carbs_pct, fats_pct = pct
             print(f"Macros: Protein {total_protein}g ({protein_pct:.0%}), Carbs {total_carbs}g ({carbs_pct:.0%}), Fats {total_fats}g ({fats_pct:.0%}).")
-            if abs(protein_pct - self.macro_goals['protein']) > 0.20:
-                print("Warning: Protein off by >20%—aim for balance.")
-            # Similar for carbs/fats (omitted for brevity; add if wanted)
+            off_goal = self._check_macros(pct)
+            for name, off in zip(('Protein', 'Carbs', 'Fats'), off_goal):
+                if off:
+                    print(f"Warning: {name} off by >20%—aim for balance.")
         else:
             print("No macros logged yet.")
 
@@ -98,38 +213,161 @@ class FitnessTracker:
     def weekly_summary(self):
         today = datetime.date.today()
         week_start = (today - datetime.timedelta(days=6)).isoformat()
-        food_cal = sum(log['calories'] for log in self.food_logs if log['date'] >= week_start)
-        exercise_cal = sum(log['calories_burned'] for log in self.exercise_logs if log['date'] >= week_start)
+        # Logs are append-only, so the date columns stay sorted: binary-search
+        # the start of the week and sum the contiguous tail slice
+        food_cal = 0.0
+        if self.food_dates:
+            start = np.searchsorted(np.asarray(self.food_dates), week_start)
+            food_cal = float(np.asarray(self.food_calories[start:]).sum())
+        exercise_cal = 0.0
+        if self.exercise_dates:
+            start = np.searchsorted(np.asarray(self.exercise_dates), week_start)
+            exercise_cal = float(np.asarray(self.exercise_calories[start:]).sum())
         avg_net = (food_cal - exercise_cal - self.bmr * 7) / 7
         print(f"Last 7 days: Avg eaten {(food_cal/7):.0f} cal, Avg burned {(exercise_cal/7):.0f} cal, Avg net {avg_net:.0f} cal.")
         est_weight_change = (food_cal - exercise_cal - self.tdee * 7) / 7700  # ~7700 cal per kg
         direction = "loss" if est_weight_change < 0 else "gain"
         print(f"Estimated weight {direction}: {abs(est_weight_change):.2f} kg (approx; track actual weight).")
 
+    # New: DataFrame views over the log columns for multi-date analytics —
+    # filters and groupbys run in pandas C code, and the categorical date
+    # column turns per-row string compares into integer code matches
+    def food_df(self):
+        return pd.DataFrame({
+            'date': pd.Categorical(self.food_dates), 'meal': self.food_meals,
+            'calories': self.food_calories, 'protein': self.food_protein,
+            'carbs': self.food_carbs, 'fats': self.food_fats
+        })
+
+    def exercise_df(self):
+        return pd.DataFrame({
+            'date': pd.Categorical(self.exercise_dates),
+            'activity': self.exercise_activities,
+            'calories': self.exercise_calories
+        })
+
+    def macro_history(self):
+        return self.food_df().groupby('date', observed=True)[
+            ['calories', 'protein', 'carbs', 'fats']].sum()
+
     # New: View historical logs
     def view_logs(self, type='all', date_str=None):
+        # Dates are appended in order, so a date's rows form one contiguous
+        # slice; binary-search its bounds instead of scanning every row
         if type == 'food' or type == 'all':
             print("Food Logs:")
-            for log in self.food_logs:
-                if date_str is None or log['date'] == date_str:
-                    print(f"{log['date']}: {log['meal']} - {log['calories']} cal (P:{log['nutrition']['protein']} C:{log['nutrition']['carbs']} F:{log['nutrition']['fats']})")
+            if date_str is None:
+                lo, hi = 0, len(self.food_dates)
+            else:
+                lo = bisect.bisect_left(self.food_dates, date_str)
+                hi = bisect.bisect_right(self.food_dates, date_str)
+            for date, meal, cal, protein, carbs, fats in zip(
+                    self.food_dates[lo:hi], self.food_meals[lo:hi],
+                    self.food_calories[lo:hi], self.food_protein[lo:hi],
+                    self.food_carbs[lo:hi], self.food_fats[lo:hi]):
+                print(f"{date}: {meal} - {cal} cal (P:{protein} C:{carbs} F:{fats})")
         if type == 'exercise' or type == 'all':
             print("Exercise Logs:")
-            for log in self.exercise_logs:
-                if date_str is None or log['date'] == date_str:
-                    print(f"{log['date']}: {log['activity']} - {log['calories_burned']} cal burned")
+            if date_str is None:
+                lo, hi = 0, len(self.exercise_dates)
+            else:
+                lo = bisect.bisect_left(self.exercise_dates, date_str)
+                hi = bisect.bisect_right(self.exercise_dates, date_str)
+            for date, activity, burned in zip(
+                    self.exercise_dates[lo:hi], self.exercise_activities[lo:hi],
+                    self.exercise_calories[lo:hi]):
+                print(f"{date}: {activity} - {burned} cal burned")
 
-    def save_to_file(self, filename='tracker_data.json'):
+    def _rebuild_daily_totals(self):
+        # One pass over each log to restore the per-date index after a load;
+        # the index is bound to a local so the loop body skips the self lookup
+        daily_totals = self._daily_totals
+        daily_totals.clear()
+        for date, cal, protein, carbs, fats in zip(
+                self.food_dates, self.food_calories,
+                self.food_protein, self.food_carbs, self.food_fats):
+            day = daily_totals[date]
+            day['calories'] += cal
+            day['protein'] += protein
+            day['carbs'] += carbs
+            day['fats'] += fats
+        for date, burned in zip(self.exercise_dates, self.exercise_calories):
+            daily_totals[date]['burned'] += burned
+
+    def save_to_file(self, filename='tracker_data.json', compact=True):
         data = {
             'height': self.height, 'weight': self.weight, 'goal_weight': self.goal_weight,
             'age': self.age, 'gender': self.gender, 'activity_level': self.activity_level,
-            'food_logs': self.food_logs, 'exercise_logs': self.exercise_logs,
+            'food_logs': {
+                'dates': self.food_dates, 'meals': self.food_meals,
+                'calories': self.food_calories, 'protein': self.food_protein,
+                'carbs': self.food_carbs, 'fats': self.food_fats
+            },
+            'exercise_logs': {
+                'dates': self.exercise_dates, 'activities': self.exercise_activities,
+                'calories': self.exercise_calories
+            },
             'macro_goals': self.macro_goals  # New: Save goals
         }
         with open(filename, 'w') as f:
-            json.dump(data, f, indent=4)
+            if compact:
+                # The file is machine-read; skipping pretty-printing keeps it
+                # ~3x smaller and speeds both dump and the next load
+                json.dump(data, f, separators=(',', ':'))
+            else:
+                json.dump(data, f, indent=4)
         print("Data saved!")
 
+    # New: Parquet storage — columnar on disk, so years of logs load without
+    # reparsing one big JSON tree (and analytics can read single columns)
+    def save_to_parquet(self, basename='tracker_data'):
+        pd.DataFrame({
+            'date': self.food_dates, 'meal': self.food_meals,
+            'calories': self.food_calories, 'protein': self.food_protein,
+            'carbs': self.food_carbs, 'fats': self.food_fats
+        }).to_parquet(f'{basename}_food.parquet')
+        pd.DataFrame({
+            'date': self.exercise_dates, 'activity': self.exercise_activities,
+            'calories': self.exercise_calories
+        }).to_parquet(f'{basename}_exercise.parquet')
+        profile = {
+            'height': self.height, 'weight': self.weight, 'goal_weight': self.goal_weight,
+            'age': self.age, 'gender': self.gender, 'activity_level': self.activity_level,
+            'macro_goals': self.macro_goals
+        }
+        with open(f'{basename}_profile.json', 'w') as f:
+            json.dump(profile, f, separators=(',', ':'))
+        print("Data saved (Parquet)!")
+
+    @classmethod
+    def load_from_parquet(cls, basename='tracker_data'):
+        profile_file = f'{basename}_profile.json'
+        if not os.path.exists(profile_file):
+            print("No saved Parquet data. Starting fresh.")
+            return None
+        with open(profile_file, 'r') as f:
+            profile = json.load(f)
+        tracker = cls(
+            profile['height'], profile['weight'], profile['goal_weight'],
+            profile['age'], profile['gender'], profile['activity_level']
+        )
+        tracker.macro_goals = profile.get('macro_goals', tracker.macro_goals)
+        tracker._compile_macro_check()
+        food = pd.read_parquet(f'{basename}_food.parquet')
+        exercise = pd.read_parquet(f'{basename}_exercise.parquet')
+        tracker.food_dates = food['date'].tolist()
+        tracker.food_meals = food['meal'].tolist()
+        tracker.food_calories = food['calories'].tolist()
+        tracker.food_protein = food['protein'].tolist()
+        tracker.food_carbs = food['carbs'].tolist()
+        tracker.food_fats = food['fats'].tolist()
+        tracker.exercise_dates = exercise['date'].tolist()
+        tracker.exercise_activities = exercise['activity'].tolist()
+        tracker.exercise_calories = exercise['calories'].tolist()
+        tracker._rebuild_daily_totals()
+        print("Loaded saved data (Parquet)!")
+        return tracker
+
     @classmethod
     def load_from_file(cls, filename='tracker_data.json'):
         if os.path.exists(filename):
@@ -139,15 +377,64 @@ class FitnessTracker:
                 data['height'], data['weight'], data['goal_weight'],
                 data['age'], data['gender'], data['activity_level']
             )
-            tracker.food_logs = data['food_logs']
-            tracker.exercise_logs = data['exercise_logs']
+            food = data['food_logs']
+            exercise = data['exercise_logs']
+            if isinstance(food, list):  # Old row-per-dict save format
+                food = {
+                    'dates': [log['date'] for log in food],
+                    'meals': [log['meal'] for log in food],
+                    'calories': [log['calories'] for log in food],
+                    'protein': [log['nutrition']['protein'] for log in food],
+                    'carbs': [log['nutrition']['carbs'] for log in food],
+                    'fats': [log['nutrition']['fats'] for log in food]
+                }
+            if isinstance(exercise, list):
+                exercise = {
+                    'dates': [log['date'] for log in exercise],
+                    'activities': [log['activity'] for log in exercise],
+                    'calories': [log['calories_burned'] for log in exercise]
+                }
+            tracker.food_dates = food['dates']
+            tracker.food_meals = food['meals']
+            tracker.food_calories = food['calories']
+            tracker.food_protein = food['protein']
+            tracker.food_carbs = food['carbs']
+            tracker.food_fats = food['fats']
+            tracker.exercise_dates = exercise['dates']
+            tracker.exercise_activities = exercise['activities']
+            tracker.exercise_calories = exercise['calories']
+            tracker._rebuild_daily_totals()
             if 'macro_goals' in data:
                 tracker.macro_goals = data['macro_goals']
+                tracker._compile_macro_check()
             print("Loaded saved data!")
             return tracker
         print("No saved data. Starting fresh.")
         return None
 
+# New: Batch import for scripted runs — dispatches straight to the log
+# methods with no prompts or per-line retry loops
+def replay(tracker, path):
+    count = 0
+    was_verbose = tracker.verbose
+    tracker.verbose = False  # One print per row would dominate the import
+    try:
+        with open(path, newline='') as f:
+            for row in csv.DictReader(f):
+                if row.get('type') == 'exercise':
+                    tracker.log_exercise(row['activity'], float(row['calories_burned']))
+                else:
+                    tracker.log_food(
+                        row['meal'], float(row['calories']),
+                        float(row.get('protein') or 0),
+                        float(row.get('carbs') or 0),
+                        float(row.get('fats') or 0)
+                    )
+                count += 1
+    finally:
+        tracker.verbose = was_verbose
+    print(f"Replayed {count} entries from {path}.")
+
 # Interactive menu (expanded)
 def main():
     filename = 'tracker_data.json'
@@ -218,8 +505,8 @@ def main():
                 age = int(input("New age: "))
                 gender = input("New gender: ").strip()
                 activity_level = input("New activity level: ").strip()
-                tracker = FitnessTracker(height, weight, goal_weight, age, gender, activity_level)
-                print("Updated! Logs preserved.")
+                tracker.update_profile(height, weight, goal_weight, age, gender, activity_level)
+                print(f"Updated! Logs preserved. New daily goal: {tracker.daily_calorie_goal:.0f} cal.")
             except ValueError as e:
                 print(f"Error: {e}.")
 